@@ -50,10 +50,18 @@ interface Report {
   }
 }
 
+interface DashboardStats {
+  totalUsers: number
+  totalVisits: number
+  activeVisits: number
+  totalReports: number
+}
+
 export default function AdminDashboard() {
   const [users, setUsers] = useState<User[]>([])
   const [visits, setVisits] = useState<Visit[]>([])
   const [reports, setReports] = useState<Report[]>([])
+  const [stats, setStats] = useState<DashboardStats | null>(null)
   const [loading, setLoading] = useState(true)
   const [user, setUser] = useState<any>(null)
   const router = useRouter()
@@ -90,18 +98,26 @@ export default function AdminDashboard() {
   const fetchData = async () => {
     try {
       const token = localStorage.getItem("token")
-      const [usersRes, visitsRes, reportsRes] = await Promise.all([
+      const [statsRes, usersRes, visitsRes, reportsRes] = await Promise.all([
+        fetch("/api/reports/dashboard", {
+          headers: { "Authorization": `Bearer ${token}` }
+        }),
         fetch("/api/users", {
           headers: { "Authorization": `Bearer ${token}` }
         }),
-        fetch("/api/visits", {
+        fetch("/api/visits?limit=10", {
           headers: { "Authorization": `Bearer ${token}` }
         }),
-        fetch("/api/reports", {
+        fetch("/api/reports?limit=10", {
           headers: { "Authorization": `Bearer ${token}` }
         })
       ])
 
+      if (statsRes.ok) {
+        const statsData = await statsRes.json()
+        setStats(statsData)
+      }
+
       if (usersRes.ok) {
         const usersData = await usersRes.json()
         setUsers(usersData)
@@ -196,7 +212,7 @@ export default function AdminDashboard() {
                 <CardTitle className="text-sm font-medium">Total Users</CardTitle>
               </CardHeader>
               <CardContent>
-                <div className="text-2xl font-bold">{users.length}</div>
+                <div className="text-2xl font-bold">{stats?.totalUsers ?? "—"}</div>
               </CardContent>
             </Card>
             <Card>
@@ -204,7 +220,7 @@ export default function AdminDashboard() {
                 <CardTitle className="text-sm font-medium">Total Visits</CardTitle>
               </CardHeader>
               <CardContent>
-                <div className="text-2xl font-bold">{visits.length}</div>
+                <div className="text-2xl font-bold">{stats?.totalVisits ?? "—"}</div>
               </CardContent>
             </Card>
             <Card>
@@ -213,7 +229,7 @@ export default function AdminDashboard() {
               </CardHeader>
               <CardContent>
                 <div className="text-2xl font-bold">
-                  {visits.filter(v => v.visitStatus !== 'COMPLETED' && v.visitStatus !== 'CANCELLED').length}
+                  {stats?.activeVisits ?? "—"}
                 </div>
               </CardContent>
             </Card>
@@ -222,7 +238,7 @@ export default function AdminDashboard() {
                 <CardTitle className="text-sm font-medium">Reports</CardTitle>
               </CardHeader>
               <CardContent>
-                <div className="text-2xl font-bold">{reports.length}</div>
+                <div className="text-2xl font-bold">{stats?.totalReports ?? "—"}</div>
               </CardContent>
             </Card>
           </div>
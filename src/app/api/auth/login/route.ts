@@ -2,6 +2,10 @@ import { NextRequest, NextResponse } from "next/server"
 import { db } from "@/lib/db"
 import bcrypt from "bcryptjs"
 
+// Hash compared against when the user is unknown or inactive, so a failed
+// login costs the same whether or not the account exists
+const dummyPasswordHash = bcrypt.hash("dummy-password", 10)
+
 export async function POST(request: NextRequest) {
   try {
     const { username, password } = await request.json()
@@ -16,19 +20,24 @@ export async function POST(request: NextRequest) {
     // Find user by username
     const user = await db.user.findUnique({
       where: { username },
+      select: {
+        id: true,
+        username: true,
+        email: true,
+        fullName: true,
+        password: true,
+        role: true,
+        isActive: true,
+      },
     })
 
-    if (!user || !user.isActive) {
-      return NextResponse.json(
-        { detail: "Invalid credentials" },
-        { status: 401 }
-      )
-    }
+    // Always run a bcrypt comparison to avoid leaking which usernames exist
+    const passwordHash = user?.isActive && user.password
+      ? user.password
+      : await dummyPasswordHash
+    const isPasswordValid = await bcrypt.compare(password, passwordHash)
 
-    // Verify password (in production, use proper password hashing)
-    const isPasswordValid = await bcrypt.compare(password, user.password || "")
-    
-    if (!isPasswordValid) {
+    if (!user || !user.isActive || !user.password || !isPasswordValid) {
       return NextResponse.json(
         { detail: "Invalid credentials" },
         { status: 401 }
@@ -1,5 +1,7 @@
 import { NextRequest, NextResponse } from "next/server"
+import { Prisma } from "@prisma/client"
 import { db } from "@/lib/db"
+import { getUserIdFromRequest } from "@/lib/auth"
 
 export async function POST(request: NextRequest) {
   try {
@@ -85,6 +87,7 @@ export async function POST(request: NextRequest) {
     // Check if visit exists
     const visit = await db.visit.findUnique({
       where: { id: visitId },
+      select: { id: true },
     })
 
     if (!visit) {
@@ -94,31 +97,16 @@ export async function POST(request: NextRequest) {
       )
     }
 
-    // Check if form already exists for this visit
-    const existingForm = await db.checkEvalForm.findUnique({
-      where: { visitId },
-    })
-
-    if (existingForm) {
-      return NextResponse.json(
-        { detail: "Check-Eval form already exists for this visit" },
-        { status: 400 }
-      )
-    }
-
     // Get user from token
-    const authHeader = request.headers.get("authorization")
-    if (!authHeader || !authHeader.startsWith("Bearer ")) {
+    const userId = getUserIdFromRequest(request)
+    if (!userId) {
       return NextResponse.json(
         { detail: "Invalid authentication" },
         { status: 401 }
       )
     }
 
-    const token = authHeader.substring(7)
-    const userId = Buffer.from(token, 'base64').toString().split(':')[0]
-
-    // Create Check-Eval form
+    // Create Check-Eval form; the unique visitId constraint rejects duplicates
     const checkEvalForm = await db.checkEvalForm.create({
       data: {
         visitId,
@@ -178,6 +166,16 @@ export async function POST(request: NextRequest) {
 
     return NextResponse.json(checkEvalForm, { status: 201 })
   } catch (error) {
+    if (
+      error instanceof Prisma.PrismaClientKnownRequestError &&
+      error.code === "P2002"
+    ) {
+      return NextResponse.json(
+        { detail: "Check-Eval form already exists for this visit" },
+        { status: 400 }
+      )
+    }
+
     console.error("Error creating Check-Eval form:", error)
     return NextResponse.json(
       { detail: "Internal server error" },
@@ -1,5 +1,7 @@
 import { NextRequest, NextResponse } from "next/server"
+import { Prisma } from "@prisma/client"
 import { db } from "@/lib/db"
+import { getUserIdFromRequest } from "@/lib/auth"
 
 export async function POST(request: NextRequest) {
   try {
@@ -24,6 +26,7 @@ export async function POST(request: NextRequest) {
     // Check if visit exists
     const visit = await db.visit.findUnique({
       where: { id: visitId },
+      select: { id: true },
     })
 
     if (!visit) {
@@ -33,31 +36,16 @@ export async function POST(request: NextRequest) {
       )
     }
 
-    // Check if form already exists for this visit
-    const existingForm = await db.generalSheetForm.findUnique({
-      where: { visitId },
-    })
-
-    if (existingForm) {
-      return NextResponse.json(
-        { detail: "General Sheet form already exists for this visit" },
-        { status: 400 }
-      )
-    }
-
     // Get user from token
-    const authHeader = request.headers.get("authorization")
-    if (!authHeader || !authHeader.startsWith("Bearer ")) {
+    const userId = getUserIdFromRequest(request)
+    if (!userId) {
       return NextResponse.json(
         { detail: "Invalid authentication" },
         { status: 401 }
       )
     }
 
-    const token = authHeader.substring(7)
-    const userId = Buffer.from(token, 'base64').toString().split(':')[0]
-
-    // Create General Sheet form
+    // Create General Sheet form; the unique visitId constraint rejects duplicates
     const generalSheetForm = await db.generalSheetForm.create({
       data: {
         visitId,
@@ -84,6 +72,16 @@ export async function POST(request: NextRequest) {
 
     return NextResponse.json(generalSheetForm, { status: 201 })
   } catch (error) {
+    if (
+      error instanceof Prisma.PrismaClientKnownRequestError &&
+      error.code === "P2002"
+    ) {
+      return NextResponse.json(
+        { detail: "General Sheet form already exists for this visit" },
+        { status: 400 }
+      )
+    }
+
     console.error("Error creating General Sheet form:", error)
     return NextResponse.json(
       { detail: "Internal server error" },
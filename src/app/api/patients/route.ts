@@ -1,4 +1,5 @@
 import { NextRequest, NextResponse } from "next/server"
+import { Prisma } from "@prisma/client"
 import { db } from "@/lib/db"
 
 export async function POST(request: NextRequest) {
@@ -30,19 +31,7 @@ export async function POST(request: NextRequest) {
       )
     }
 
-    // Check if patient already exists
-    const existingPatient = await db.patient.findUnique({
-      where: { ssn },
-    })
-
-    if (existingPatient) {
-      return NextResponse.json(
-        { detail: "Patient with this SSN already exists" },
-        { status: 400 }
-      )
-    }
-
-    // Create patient
+    // Create patient; the SSN primary key rejects duplicates
     const patient = await db.patient.create({
       data: {
         ssn,
@@ -56,6 +45,16 @@ export async function POST(request: NextRequest) {
 
     return NextResponse.json(patient, { status: 201 })
   } catch (error) {
+    if (
+      error instanceof Prisma.PrismaClientKnownRequestError &&
+      error.code === "P2002"
+    ) {
+      return NextResponse.json(
+        { detail: "Patient with this SSN already exists" },
+        { status: 400 }
+      )
+    }
+
     console.error("Error creating patient:", error)
     return NextResponse.json(
       { detail: "Internal server error" },
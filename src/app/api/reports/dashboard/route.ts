@@ -0,0 +1,48 @@
+import { NextResponse } from "next/server"
+import { db } from "@/lib/db"
+import {
+  type DashboardStats,
+  getCachedDashboardStats,
+  setCachedDashboardStats,
+} from "@/lib/dashboard"
+
+export async function GET() {
+  try {
+    const cached = getCachedDashboardStats()
+    if (cached) {
+      return NextResponse.json(cached)
+    }
+
+    // All counts in one statement: scalar subqueries for users and reports,
+    // and a single scan of visits for both visit totals
+    const [row] = await db.$queryRaw<Array<Record<keyof DashboardStats, bigint | number>>>`
+      SELECT
+        (SELECT COUNT(*) FROM users) AS totalUsers,
+        v.totalVisits,
+        v.activeVisits,
+        (SELECT COUNT(*) FROM reports) AS totalReports
+      FROM (
+        SELECT
+          COUNT(*) AS totalVisits,
+          COUNT(CASE WHEN visitStatus IN ('OPEN', 'IN_PROGRESS') THEN 1 END) AS activeVisits
+        FROM visits
+      ) AS v
+    `
+
+    const stats: DashboardStats = {
+      totalUsers: Number(row.totalUsers),
+      totalVisits: Number(row.totalVisits),
+      activeVisits: Number(row.activeVisits),
+      totalReports: Number(row.totalReports),
+    }
+    setCachedDashboardStats(stats)
+
+    return NextResponse.json(stats)
+  } catch (error) {
+    console.error("Error fetching dashboard stats:", error)
+    return NextResponse.json(
+      { detail: "Internal server error" },
+      { status: 500 }
+    )
+  }
+}
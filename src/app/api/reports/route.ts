@@ -1,5 +1,7 @@
 import { NextRequest, NextResponse } from "next/server"
 import { db } from "@/lib/db"
+import { getUserIdFromRequest } from "@/lib/auth"
+import { invalidateDashboardStats } from "@/lib/dashboard"
 
 export async function GET(request: NextRequest) {
   try {
@@ -61,6 +63,7 @@ export async function POST(request: NextRequest) {
     // Check if visit exists
     const visit = await db.visit.findUnique({
       where: { id: visitId },
+      select: { id: true },
     })
 
     if (!visit) {
@@ -71,17 +74,14 @@ export async function POST(request: NextRequest) {
     }
 
     // Get user from token (simplified)
-    const authHeader = request.headers.get("authorization")
-    if (!authHeader || !authHeader.startsWith("Bearer ")) {
+    const userId = getUserIdFromRequest(request)
+    if (!userId) {
       return NextResponse.json(
         { detail: "Invalid authentication" },
         { status: 401 }
       )
     }
 
-    const token = authHeader.substring(7)
-    const userId = Buffer.from(token, 'base64').toString().split(':')[0]
-
     // Create report
     const report = await db.report.create({
       data: {
@@ -112,6 +112,8 @@ export async function POST(request: NextRequest) {
       },
     })
 
+    invalidateDashboardStats()
+
     return NextResponse.json(report, { status: 201 })
   } catch (error) {
     console.error("Error creating report:", error)
@@ -1,5 +1,7 @@
 import { NextRequest, NextResponse } from "next/server"
+import { Prisma } from "@prisma/client"
 import { db } from "@/lib/db"
+import { invalidateAuthUser } from "@/lib/auth"
 
 export async function GET(
   request: NextRequest,
@@ -48,12 +50,18 @@ export async function PUT(
     const body = await request.json()
     const { email, fullName, role, isActive } = body
 
-    // Check if user exists
-    const existingUser = await db.user.findUnique({
-      where: { id },
+    // Load the user and any other user holding the new email in one query
+    const matches = await db.user.findMany({
+      where: {
+        OR: [
+          { id },
+          ...(email ? [{ email }] : []),
+        ],
+      },
+      select: { id: true },
     })
 
-    if (!existingUser) {
+    if (!matches.some((user) => user.id === id)) {
       return NextResponse.json(
         { detail: "User not found" },
         { status: 404 }
@@ -61,20 +69,11 @@ export async function PUT(
     }
 
     // Check if email is already taken by another user
-    if (email && email !== existingUser.email) {
-      const emailTaken = await db.user.findFirst({
-        where: {
-          email,
-          NOT: { id },
-        },
-      })
-
-      if (emailTaken) {
-        return NextResponse.json(
-          { detail: "Email is already taken by another user" },
-          { status: 400 }
-        )
-      }
+    if (matches.some((user) => user.id !== id)) {
+      return NextResponse.json(
+        { detail: "Email is already taken by another user" },
+        { status: 400 }
+      )
     }
 
     // Update user
@@ -98,8 +97,20 @@ export async function PUT(
       },
     })
 
+    invalidateAuthUser(id)
+
     return NextResponse.json(updatedUser)
   } catch (error) {
+    if (
+      error instanceof Prisma.PrismaClientKnownRequestError &&
+      error.code === "P2002"
+    ) {
+      return NextResponse.json(
+        { detail: "Email is already taken by another user" },
+        { status: 400 }
+      )
+    }
+
     console.error("Error updating user:", error)
     return NextResponse.json(
       { detail: "Internal server error" },
@@ -118,6 +129,7 @@ export async function DELETE(
     // Check if user exists
     const user = await db.user.findUnique({
       where: { id },
+      select: { id: true },
     })
 
     if (!user) {
@@ -133,6 +145,8 @@ export async function DELETE(
       data: { isActive: false },
     })
 
+    invalidateAuthUser(id)
+
     return NextResponse.json({ message: "User deactivated successfully" })
   } catch (error) {
     console.error("Error deactivating user:", error)
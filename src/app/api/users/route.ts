@@ -1,5 +1,7 @@
 import { NextRequest, NextResponse } from "next/server"
+import { Prisma } from "@prisma/client"
 import { db } from "@/lib/db"
+import { invalidateDashboardStats } from "@/lib/dashboard"
 import bcrypt from "bcryptjs"
 
 export async function GET(request: NextRequest) {
@@ -49,27 +51,10 @@ export async function POST(request: NextRequest) {
       )
     }
 
-    // Check if user already exists
-    const existingUser = await db.user.findFirst({
-      where: {
-        OR: [
-          { username },
-          { email }
-        ]
-      },
-    })
-
-    if (existingUser) {
-      return NextResponse.json(
-        { detail: "User with this username or email already exists" },
-        { status: 400 }
-      )
-    }
-
     // Hash password
     const hashedPassword = await bcrypt.hash(password, 10)
 
-    // Create user
+    // Create user; the unique username/email constraints reject duplicates
     const user = await db.user.create({
       data: {
         username,
@@ -90,8 +75,20 @@ export async function POST(request: NextRequest) {
       },
     })
 
+    invalidateDashboardStats()
+
     return NextResponse.json(user, { status: 201 })
   } catch (error) {
+    if (
+      error instanceof Prisma.PrismaClientKnownRequestError &&
+      error.code === "P2002"
+    ) {
+      return NextResponse.json(
+        { detail: "User with this username or email already exists" },
+        { status: 400 }
+      )
+    }
+
     console.error("Error creating user:", error)
     return NextResponse.json(
       { detail: "Internal server error" },
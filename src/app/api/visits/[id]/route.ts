@@ -1,5 +1,7 @@
 import { NextRequest, NextResponse } from "next/server"
+import { Prisma } from "@prisma/client"
 import { db } from "@/lib/db"
+import { invalidateDashboardStats } from "@/lib/dashboard"
 
 export async function GET(
   request: NextRequest,
@@ -49,19 +51,7 @@ export async function PUT(
     const body = await request.json()
     const { notes, visitStatus } = body
 
-    // Check if visit exists
-    const existingVisit = await db.visit.findUnique({
-      where: { id },
-    })
-
-    if (!existingVisit) {
-      return NextResponse.json(
-        { detail: "Visit not found" },
-        { status: 404 }
-      )
-    }
-
-    // Update visit
+    // Update visit (a missing visit surfaces as P2025 from the update itself)
     const updatedVisit = await db.visit.update({
       where: { id },
       data: {
@@ -82,8 +72,20 @@ export async function PUT(
       },
     })
 
+    invalidateDashboardStats()
+
     return NextResponse.json(updatedVisit)
   } catch (error) {
+    if (
+      error instanceof Prisma.PrismaClientKnownRequestError &&
+      error.code === "P2025"
+    ) {
+      return NextResponse.json(
+        { detail: "Visit not found" },
+        { status: 404 }
+      )
+    }
+
     console.error("Error updating visit:", error)
     return NextResponse.json(
       { detail: "Internal server error" },
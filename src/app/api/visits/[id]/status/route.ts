@@ -1,5 +1,6 @@
 import { NextRequest, NextResponse } from "next/server"
 import { db } from "@/lib/db"
+import { invalidateDashboardStats } from "@/lib/dashboard"
 
 export async function PUT(
   request: NextRequest,
@@ -18,12 +19,13 @@ export async function PUT(
       )
     }
 
-    // Check if visit exists
+    // Check if visit exists; only the form ids are needed for the completion check
     const visit = await db.visit.findUnique({
       where: { id: params.id },
-      include: {
-        checkEval: true,
-        generalSheet: true,
+      select: {
+        id: true,
+        checkEval: { select: { id: true } },
+        generalSheet: { select: { id: true } },
       }
     })
 
@@ -56,16 +58,23 @@ export async function PUT(
       where: { id: params.id },
       data: {
         visitStatus: status,
-        updatedAt: new Date(),
       },
       include: {
         patient: true,
-        user: true,
+        user: {
+          select: {
+            fullName: true,
+            username: true,
+            role: true,
+          },
+        },
         checkEval: true,
         generalSheet: true,
       }
     })
 
+    invalidateDashboardStats()
+
     return NextResponse.json(updatedVisit)
   } catch (error) {
     console.error("Error updating visit status:", error)
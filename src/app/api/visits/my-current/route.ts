@@ -1,27 +1,22 @@
 import { NextRequest, NextResponse } from "next/server"
 import { db } from "@/lib/db"
+import { getAuthUser, getUserIdFromRequest } from "@/lib/auth"
 
 export async function GET(request: NextRequest) {
   try {
     // Get user from token (simplified - in production, use proper JWT verification)
-    const authHeader = request.headers.get("authorization")
-    if (!authHeader || !authHeader.startsWith("Bearer ")) {
+    const userId = getUserIdFromRequest(request)
+    if (!userId) {
       return NextResponse.json(
         { detail: "Invalid authentication" },
         { status: 401 }
       )
     }
 
-    const token = authHeader.substring(7)
-    const userId = Buffer.from(token, 'base64').toString().split(':')[0]
+    // Verify user exists, is active and has NURSE role
+    const user = await getAuthUser(userId)
 
-    // Verify user exists and has NURSE role
-    const user = await db.user.findUnique({
-      where: { id: userId },
-      select: { role: true }
-    })
-
-    if (!user || user.role !== "NURSE") {
+    if (!user || !user.isActive || user.role !== "NURSE") {
       return NextResponse.json(
         { detail: "Access denied. Nurse role required." },
         { status: 403 }
@@ -1,14 +1,18 @@
 import { NextRequest, NextResponse } from "next/server"
 import { db } from "@/lib/db"
+import { getUserIdFromRequest } from "@/lib/auth"
+import { invalidateDashboardStats } from "@/lib/dashboard"
 
 export async function GET(request: NextRequest) {
   try {
     const { searchParams } = new URL(request.url)
     const skip = parseInt(searchParams.get("skip") || "0")
     const limit = parseInt(searchParams.get("limit") || "100")
+    // Id of the last visit from the previous page; seeks instead of offsetting
+    const cursor = searchParams.get("cursor")
 
     const visits = await db.visit.findMany({
-      skip,
+      ...(cursor ? { cursor: { id: cursor }, skip: 1 } : { skip }),
       take: limit,
       include: {
         patient: {
@@ -24,9 +28,10 @@ export async function GET(request: NextRequest) {
           },
         },
       },
-      orderBy: {
-        visitDate: "desc",
-      },
+      orderBy: [
+        { visitDate: "desc" },
+        { id: "desc" },
+      ],
     })
 
     return NextResponse.json(visits)
@@ -55,6 +60,7 @@ export async function POST(request: NextRequest) {
     // Check if patient exists
     const patient = await db.patient.findUnique({
       where: { ssn: patientSsn },
+      select: { ssn: true },
     })
 
     if (!patient) {
@@ -65,17 +71,14 @@ export async function POST(request: NextRequest) {
     }
 
     // Get user from token (simplified - in production, use proper JWT verification)
-    const authHeader = request.headers.get("authorization")
-    if (!authHeader || !authHeader.startsWith("Bearer ")) {
+    const userId = getUserIdFromRequest(request)
+    if (!userId) {
       return NextResponse.json(
         { detail: "Invalid authentication" },
         { status: 401 }
       )
     }
 
-    const token = authHeader.substring(7)
-    const userId = Buffer.from(token, 'base64').toString().split(':')[0]
-
     // Create visit
     const visit = await db.visit.create({
       data: {
@@ -94,6 +97,8 @@ export async function POST(request: NextRequest) {
       },
     })
 
+    invalidateDashboardStats()
+
     return NextResponse.json(visit, { status: 201 })
   } catch (error) {
     console.error("Error creating visit:", error)
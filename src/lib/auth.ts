@@ -0,0 +1,53 @@
+import { NextRequest } from "next/server"
+import { Role } from "@prisma/client"
+import { db } from "@/lib/db"
+
+const USER_CACHE_TTL_MS = 60_000
+const USER_CACHE_MAX_ENTRIES = 1000
+
+type CachedUser = { role: Role; isActive: boolean }
+
+// Process-local cache of the user fields checked on authenticated requests
+const userCache = new Map<string, { user: CachedUser; expiresAt: number }>()
+
+// Get user id from the bearer token (simplified - in production, use proper JWT verification)
+export function getUserIdFromRequest(request: NextRequest): string | null {
+  const authHeader = request.headers.get("authorization")
+  if (!authHeader || !authHeader.startsWith("Bearer ")) {
+    return null
+  }
+
+  const token = authHeader.substring(7)
+  return Buffer.from(token, "base64").toString().split(":")[0]
+}
+
+// Look up the role and active flag for a user, served from cache for a short TTL
+export async function getAuthUser(userId: string): Promise<CachedUser | null> {
+  const cached = userCache.get(userId)
+  if (cached && cached.expiresAt > Date.now()) {
+    return cached.user
+  }
+
+  const user = await db.user.findUnique({
+    where: { id: userId },
+    select: { role: true, isActive: true },
+  })
+
+  if (!user) {
+    userCache.delete(userId)
+    return null
+  }
+
+  if (userCache.size >= USER_CACHE_MAX_ENTRIES) {
+    // Maps iterate in insertion order, so this evicts the oldest entry
+    userCache.delete(userCache.keys().next().value!)
+  }
+  userCache.set(userId, { user, expiresAt: Date.now() + USER_CACHE_TTL_MS })
+
+  return user
+}
+
+// Drop a cached user after its role or active flag changes
+export function invalidateAuthUser(userId: string) {
+  userCache.delete(userId)
+}
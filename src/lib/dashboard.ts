@@ -0,0 +1,27 @@
+const DASHBOARD_CACHE_TTL_MS = 30_000
+
+export type DashboardStats = {
+  totalUsers: number
+  totalVisits: number
+  activeVisits: number
+  totalReports: number
+}
+
+// Last computed stats; repeated dashboard loads within the TTL skip the database
+let cachedStats: { stats: DashboardStats; expiresAt: number } | null = null
+
+export function getCachedDashboardStats(): DashboardStats | null {
+  if (cachedStats && cachedStats.expiresAt > Date.now()) {
+    return cachedStats.stats
+  }
+  return null
+}
+
+export function setCachedDashboardStats(stats: DashboardStats) {
+  cachedStats = { stats, expiresAt: Date.now() + DASHBOARD_CACHE_TTL_MS }
+}
+
+// Drop cached stats after a write that changes any of the counts
+export function invalidateDashboardStats() {
+  cachedStats = null
+}